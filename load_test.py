@@ -0,0 +1,365 @@
+"""
+Load-testing harness for the RAG chat path.
+
+Drives N concurrent simulated chat sessions through the same chain and
+citation logic used by execute_ai_action (retrieval + streamed generation),
+with a stub LLM at a configurable token rate and a local embedder, so no
+API keys or network are needed. Each concurrency level reports throughput,
+TTFT and end-to-end latency percentiles, RSS per session and CPU saturation,
+and the full run is written as JSON for capacity planning.
+
+Usage:
+    python load_test.py --sessions 1,2,4,8,16 --turns 6 --out load_report.json
+"""
+import os
+import sys
+import math
+import json
+import time
+import random
+import argparse
+import threading
+import platform
+from datetime import datetime
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+from rag_logic.chat_handler import format_citations
+from rag_logic.llm_handler import build_rag_chain
+from rag_logic.pdf_handler import get_pdf_documents, get_text_chunks
+from rag_logic.vector_handler import create_vectorstore, get_embeddings
+
+# Mix of quick-action button prompts (app.py / chat_handler.py) and free-form questions
+DEFAULT_SCRIPT = [
+    {"kind": "quick_action", "prompt": "Summarize the key risks or challenges mentioned in these documents."},
+    {"kind": "question", "prompt": "What does the report say about quarterly revenue growth?"},
+    {"kind": "quick_action", "prompt": "Extract any statistical data or key metrics found in these files."},
+    {"kind": "question", "prompt": "Which teams are responsible for the infrastructure migration?"},
+    {"kind": "quick_action", "prompt": "Draft a professional one-paragraph brief based on the content."},
+    {"kind": "question", "prompt": "Are there any deadlines or milestones mentioned for next year?"},
+    {"kind": "quick_action", "prompt": "What are the core action items or conclusions in these files?"},
+    {"kind": "question", "prompt": "How is customer retention measured in these documents?"},
+]
+
+VOCAB = (
+    "revenue growth risk compliance infrastructure migration customer retention "
+    "quarterly forecast budget milestone deadline team security latency model "
+    "pipeline vendor contract audit policy market strategy churn metric target "
+    "analysis report board investment capacity region launch roadmap"
+).split()
+
+
+class StubChatModel(BaseChatModel):
+    """Chat model that streams canned tokens at a fixed rate after a first-token delay."""
+
+    tokens_per_second: float = 50.0
+    first_token_delay: float = 0.3
+    response_tokens: int = 120
+
+    @property
+    def _llm_type(self):
+        return "stub"
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        time.sleep(self.first_token_delay)
+        for i in range(self.response_tokens):
+            if i:
+                time.sleep(1.0 / self.tokens_per_second)
+            chunk = ChatGenerationChunk(message=AIMessageChunk(content=VOCAB[i % len(VOCAB)] + " "))
+            if run_manager:
+                run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+            yield chunk
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        text = "".join(chunk.text for chunk in self._stream(messages, stop, run_manager, **kwargs))
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=text))])
+
+
+def get_synthetic_chunks(num_chunks, num_files=20, seed=0):
+    """Random-word chunks spread over a handful of fake PDFs, shaped like get_text_chunks output"""
+    rng = random.Random(seed)
+    return [
+        Document(
+            page_content=" ".join(rng.choice(VOCAB) for _ in range(400)),
+            metadata={"source": f"document_{i % num_files}.pdf", "page": i // num_files + 1}
+        )
+        for i in range(num_chunks)
+    ]
+
+
+def current_rss():
+    """Resident set size of this process in bytes"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        import resource
+        # Peak rather than current RSS, but the best available without /proc
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def cpu_count():
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile; None for an empty sample"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def summarize(values):
+    return {
+        "p50": percentile(values, 50),
+        "p90": percentile(values, 90),
+        "p99": percentile(values, 99),
+        "max": max(values) if values else None,
+    }
+
+
+class RssSampler(threading.Thread):
+    """Background thread that tracks peak RSS while a concurrency level runs."""
+
+    def __init__(self, interval=0.05):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.peak = current_rss()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.is_set():
+            self.peak = max(self.peak, current_rss())
+            self._stop_event.wait(self.interval)
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+        self.peak = max(self.peak, current_rss())
+
+
+def run_turn(chain, prompt, history, model_label):
+    """
+    One chat turn, mirroring execute_ai_action without the Streamlit rendering.
+    """
+    history.append({"role": "user", "content": prompt})
+    start_time = time.perf_counter()
+    ttft = None
+    full_answer = ""
+    answer_tokens = 0
+    sources_list = []
+
+    for chunk in chain.stream(prompt):
+        if "answer" in chunk and chunk["answer"]:
+            if ttft is None:
+                ttft = time.perf_counter() - start_time
+            full_answer += chunk["answer"]
+            # The stub streams one token per chunk, matching --token-rate units
+            answer_tokens += 1
+        if "sources" in chunk:
+            sources_list.extend(chunk["sources"])
+
+    latency = time.perf_counter() - start_time
+    citation_str = f"📄 **Sources**: {format_citations(sources_list)}" if sources_list else ""
+
+    history.append({
+        "role": "assistant",
+        "content": full_answer,
+        "metadata": {
+            "model": model_label,
+            "time": datetime.now().strftime("%H:%M:%S"),
+            "latency": f"{latency:.2f}s",
+            "sources_text": citation_str
+        }
+    })
+
+    return {
+        "ttft": ttft if ttft is not None else latency,
+        "latency": latency,
+        "tokens": answer_tokens,
+        "sources": len(sources_list),
+    }
+
+
+def run_session(session_id, chain, script, turns, think_time, results, errors, start_barrier):
+    history = []
+    rng = random.Random(session_id)
+    start_barrier.wait()
+    for turn in range(turns):
+        step = script[(session_id + turn) % len(script)]
+        try:
+            result = run_turn(chain, step["prompt"], history, "stub/load-test")
+            result.update({"session": session_id, "kind": step.get("kind", "question")})
+            results.append(result)
+        except Exception as e:
+            errors.append(f"session {session_id} turn {turn}: {e}")
+        if think_time:
+            time.sleep(rng.uniform(0, 2 * think_time))
+
+
+def run_level(num_sessions, chain, script, turns, think_time):
+    """Runs one concurrency level and returns its metrics"""
+    results, errors = [], []
+    start_barrier = threading.Barrier(num_sessions + 1)
+    threads = [
+        threading.Thread(
+            target=run_session,
+            args=(i, chain, script, turns, think_time, results, errors, start_barrier)
+        )
+        for i in range(num_sessions)
+    ]
+
+    rss_before = current_rss()
+    sampler = RssSampler()
+    sampler.start()
+    for t in threads:
+        t.start()
+
+    start_barrier.wait()
+    wall_start = time.perf_counter()
+    cpu_start = sum(os.times()[:2])
+    for t in threads:
+        t.join()
+    wall = time.perf_counter() - wall_start
+    cpu = sum(os.times()[:2]) - cpu_start
+    sampler.stop()
+
+    ttfts = [r["ttft"] for r in results]
+    latencies = [r["latency"] for r in results]
+    tokens = sum(r["tokens"] for r in results)
+
+    return {
+        "sessions": num_sessions,
+        "requests": len(results),
+        "errors": errors,
+        "wall_seconds": wall,
+        "throughput_rps": len(results) / wall if wall else 0.0,
+        "throughput_tokens_per_second": tokens / wall if wall else 0.0,
+        "ttft_seconds": summarize(ttfts),
+        "latency_seconds": summarize(latencies),
+        "ttft_by_kind": {
+            kind: summarize([r["ttft"] for r in results if r["kind"] == kind])
+            for kind in sorted({r["kind"] for r in results})
+        },
+        "rss_before_bytes": rss_before,
+        "rss_peak_bytes": sampler.peak,
+        "rss_per_session_bytes": max(0, sampler.peak - rss_before) / num_sessions,
+        "cpu_seconds": cpu,
+        # Share of all available cores used by this process during the level
+        "cpu_saturation": cpu / (wall * cpu_count()) if wall else 0.0,
+    }
+
+
+def build_corpus(args):
+    if args.pdf:
+        files = [open(path, "rb") for path in args.pdf]
+        try:
+            return get_text_chunks(get_pdf_documents(files))
+        finally:
+            for f in files:
+                f.close()
+    return get_synthetic_chunks(args.chunks, seed=args.seed)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate concurrent chat sessions against the RAG chain.")
+    parser.add_argument("--sessions", default="1,2,4,8,16", help="Comma-separated concurrency levels")
+    parser.add_argument("--turns", type=int, default=6, help="Chat turns per session")
+    parser.add_argument("--think-time", type=float, default=0.0, help="Mean pause between turns (seconds)")
+    parser.add_argument("--script", help="JSON file with a list of {kind, prompt} turns")
+    parser.add_argument("--pdf", nargs="*", help="PDFs to index instead of the synthetic corpus")
+    parser.add_argument("--chunks", type=int, default=2000, help="Synthetic corpus size in chunks")
+    parser.add_argument("--embedder", choices=["fake", "hf"], default="fake",
+                        help="fake: deterministic hash embeddings, hf: local MiniLM (Groq default)")
+    parser.add_argument("--token-rate", type=float, default=50.0, help="Stub LLM tokens per second")
+    parser.add_argument("--first-token-delay", type=float, default=0.3, help="Stub LLM delay before first token")
+    parser.add_argument("--response-tokens", type=int, default=120, help="Stub LLM tokens per answer")
+    parser.add_argument("--ttft-budget", type=float, default=2.0,
+                        help="p90 TTFT (seconds) above which a level counts as saturated")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="load_report.json", help="Where to write the JSON report")
+    args = parser.parse_args(argv)
+
+    try:
+        args.levels = [int(n) for n in args.sessions.split(",") if n.strip()]
+    except ValueError:
+        parser.error(f"--sessions must be comma-separated integers, got {args.sessions!r}")
+    if not args.levels or min(args.levels) < 1:
+        parser.error(f"--sessions levels must be at least 1, got {args.sessions!r}")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    script = DEFAULT_SCRIPT
+    if args.script:
+        with open(args.script, encoding="utf-8") as f:
+            script = json.load(f)
+
+    if args.embedder == "hf":
+        embedding = get_embeddings("Groq")
+    else:
+        embedding = DeterministicFakeEmbedding(size=384)
+
+    print("Building index...")
+    chunks = build_corpus(args)
+    index_start = time.perf_counter()
+    vectorstore = create_vectorstore(chunks, "Groq", None, "FAISS (Memory-based)", embedding=embedding)
+    index_seconds = time.perf_counter() - index_start
+
+    llm = StubChatModel(
+        tokens_per_second=args.token_rate,
+        first_token_delay=args.first_token_delay,
+        response_tokens=args.response_tokens
+    )
+    chain = build_rag_chain(llm, vectorstore)
+
+    print(f"{'sessions':>8} {'req/s':>7} {'tok/s':>8} {'ttft p50':>9} {'ttft p90':>9} "
+          f"{'e2e p50':>8} {'e2e p90':>8} {'e2e p99':>8} {'MB/sess':>8} {'cpu':>6}")
+    level_reports = []
+    for n in args.levels:
+        report = run_level(n, chain, script, args.turns, args.think_time)
+        level_reports.append(report)
+        print(f"{n:>8} {report['throughput_rps']:>7.2f} {report['throughput_tokens_per_second']:>8.1f} "
+              f"{report['ttft_seconds']['p50'] or 0:>9.3f} {report['ttft_seconds']['p90'] or 0:>9.3f} "
+              f"{report['latency_seconds']['p50'] or 0:>8.3f} {report['latency_seconds']['p90'] or 0:>8.3f} "
+              f"{report['latency_seconds']['p99'] or 0:>8.3f} "
+              f"{report['rss_per_session_bytes'] / 2**20:>8.2f} {report['cpu_saturation']:>6.1%}")
+        if report["errors"]:
+            print(f"         {len(report['errors'])} errors, first: {report['errors'][0]}")
+
+    within_budget = [
+        r["sessions"] for r in level_reports
+        if not r["errors"] and (r["ttft_seconds"]["p90"] or 0) <= args.ttft_budget
+    ]
+    max_sessions = max(within_budget) if within_budget else 0
+    print(f"Max sessions within {args.ttft_budget}s p90 TTFT: {max_sessions}")
+
+    full_report = {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "host": {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "cpus": cpu_count(),
+        },
+        "config": vars(args),
+        "corpus": {"chunks": len(chunks), "index_seconds": index_seconds},
+        "levels": level_reports,
+        "max_sessions_within_ttft_budget": max_sessions,
+    }
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(full_report, f, indent=2)
+    print(f"Report written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
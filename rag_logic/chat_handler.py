@@ -31,6 +31,18 @@ def estimate_tokens(text):
     """Simple heuristic for token estimation (4 chars per token)"""
     return len(text) // 4
 
+def format_citations(sources_list):
+    """Groups retrieved chunks by source file into a 'file (Pg. x, y)' citation line"""
+    unique_sources = {}
+    for doc in sources_list:
+        src = doc.metadata.get("source", "Unknown")
+        pg = doc.metadata.get("page", "?")
+        if src not in unique_sources:
+            unique_sources[src] = set()
+        unique_sources[src].add(str(pg))
+
+    return " | ".join([f"**{k}** (Pg. {', '.join(sorted(v))})" for k, v in unique_sources.items()])
+
 
 def render_chat_messages():
     for msg in st.session_state.chat_history:
@@ -98,15 +110,7 @@ def execute_ai_action(chain, model_provider, model_name, prompt):
         
         # Display Citations if sources found
         if sources_list:
-            unique_sources = {}
-            for doc in sources_list:
-                src = doc.metadata.get("source", "Unknown")
-                pg = doc.metadata.get("page", "?")
-                if src not in unique_sources:
-                    unique_sources[src] = set()
-                unique_sources[src].add(str(pg))
-            
-            citation_content = " | ".join([f"**{k}** (Pg. {', '.join(sorted(v))})" for k, v in unique_sources.items()])
+            citation_content = format_citations(sources_list)
             citation_str = f"📄 **Sources**: {citation_content}"
             
             # Interactive Badge UI
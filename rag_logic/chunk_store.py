@@ -0,0 +1,135 @@
+import os
+import json
+import mmap
+from collections.abc import Mapping
+
+import numpy as np
+from langchain_core.documents import Document
+from langchain_community.docstore.base import Docstore
+
+TEXT_FILE = "text.bin"
+OFFSETS_FILE = "offsets.npy"
+SOURCE_ID_FILE = "source_id.npy"
+PAGE_FILE = "page.npy"
+SOURCES_FILE = "sources.json"
+
+# Sentinel stored in the page column when a chunk has no page metadata
+NO_PAGE = -1
+
+
+def build_chunk_store(documents, path):
+    """
+    Writes Document chunks to a compact columnar store on disk.
+    Text goes into a single UTF-8 arena, source/page into int32 columns
+    and source names are interned, so row i matches vector row i.
+    """
+    os.makedirs(path, exist_ok=True)
+    sources = []
+    source_ids = {}
+    offsets = np.zeros(len(documents) + 1, dtype=np.int64)
+    source_col = np.zeros(len(documents), dtype=np.int32)
+    page_col = np.full(len(documents), NO_PAGE, dtype=np.int32)
+
+    with open(os.path.join(path, TEXT_FILE), "wb") as f:
+        for i, doc in enumerate(documents):
+            data = doc.page_content.encode("utf-8")
+            f.write(data)
+            offsets[i + 1] = offsets[i] + len(data)
+
+            src = doc.metadata.get("source", "Unknown")
+            if src not in source_ids:
+                source_ids[src] = len(sources)
+                sources.append(src)
+            source_col[i] = source_ids[src]
+
+            pg = doc.metadata.get("page")
+            if isinstance(pg, int):
+                page_col[i] = pg
+
+    np.save(os.path.join(path, OFFSETS_FILE), offsets)
+    np.save(os.path.join(path, SOURCE_ID_FILE), source_col)
+    np.save(os.path.join(path, PAGE_FILE), page_col)
+    with open(os.path.join(path, SOURCES_FILE), "w", encoding="utf-8") as f:
+        json.dump(sources, f)
+
+    return ChunkStore(path)
+
+
+class ChunkStore:
+    """
+    Read-only, memory-mapped view over a store written by build_chunk_store.
+    Chunks are looked up by vector row id and materialized as Documents on demand.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.offsets = np.load(os.path.join(path, OFFSETS_FILE), mmap_mode="r")
+        self.source_id = np.load(os.path.join(path, SOURCE_ID_FILE), mmap_mode="r")
+        self.page = np.load(os.path.join(path, PAGE_FILE), mmap_mode="r")
+        with open(os.path.join(path, SOURCES_FILE), encoding="utf-8") as f:
+            self.sources = json.load(f)
+
+        # mmap refuses empty files, so an empty arena stays as plain bytes
+        with open(os.path.join(path, TEXT_FILE), "rb") as f:
+            if os.fstat(f.fileno()).st_size:
+                self._text = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                self._text = b""
+
+    def __len__(self):
+        return len(self.source_id)
+
+    def text(self, row):
+        start, end = int(self.offsets[row]), int(self.offsets[row + 1])
+        return self._text[start:end].decode("utf-8")
+
+    def metadata(self, row):
+        meta = {"source": self.sources[int(self.source_id[row])]}
+        pg = int(self.page[row])
+        if pg != NO_PAGE:
+            meta["page"] = pg
+        return meta
+
+    def document(self, row):
+        return Document(page_content=self.text(row), metadata=self.metadata(row))
+
+    def __getitem__(self, row):
+        if not 0 <= row < len(self):
+            raise IndexError(f"Chunk row out of range: {row}")
+        return self.document(row)
+
+
+class RowIdMap(Mapping):
+    """
+    Identity mapping from FAISS row to docstore id, so no per-chunk dict is kept.
+    """
+
+    def __init__(self, size):
+        self.size = size
+
+    def __getitem__(self, row):
+        row = int(row)
+        if not 0 <= row < self.size:
+            raise KeyError(row)
+        return row
+
+    def __iter__(self):
+        return iter(range(self.size))
+
+    def __len__(self):
+        return self.size
+
+
+class ChunkStoreDocstore(Docstore):
+    """
+    Docstore backed by a ChunkStore, keyed by vector row id.
+    """
+
+    def __init__(self, chunk_store):
+        self.chunk_store = chunk_store
+
+    def search(self, search):
+        try:
+            return self.chunk_store[int(search)]
+        except (IndexError, ValueError):
+            return f"ID {search} not found."
@@ -8,15 +8,6 @@ def get_llm_chain(model_provider, model, vectorstore, api_key=None):
     """
     Builds and returns a LangChain RAG chain using LCEL.
     """
-    from langchain_core.prompts import ChatPromptTemplate
-    from langchain_core.output_parsers import StrOutputParser
-    from langchain_core.runnables import RunnablePassthrough, RunnableParallel
-    
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", "You are a professional research assistant. Answer as detailed as possible using the context below. If you don't find the answer in the context, say 'I don't know.'"),
-        ("human", "Context:\n{context}\n\nQuestion:\n{input}")
-    ])
-
     if model_provider.lower() == "groq":
         from langchain_groq import ChatGroq
         llm = ChatGroq(model=model, api_key=api_key or GROQ_API_KEY)
@@ -26,6 +17,21 @@ def get_llm_chain(model_provider, model, vectorstore, api_key=None):
     else:
         raise ValueError(f"Unsupported provider: {model_provider}")
 
+    return build_rag_chain(llm, vectorstore)
+
+def build_rag_chain(llm, vectorstore):
+    """
+    Wires the retriever, prompt and any chat model into the streaming RAG chain.
+    """
+    from langchain_core.prompts import ChatPromptTemplate
+    from langchain_core.output_parsers import StrOutputParser
+    from langchain_core.runnables import RunnablePassthrough, RunnableParallel
+    
+    prompt = ChatPromptTemplate.from_messages([
+        ("system", "You are a professional research assistant. Answer as detailed as possible using the context below. If you don't find the answer in the context, say 'I don't know.'"),
+        ("human", "Context:\n{context}\n\nQuestion:\n{input}")
+    ])
+
     retriever = vectorstore.as_retriever(search_kwargs={"k": 3})
     
     # LCEL Chain Construction with Source Documents
@@ -17,15 +17,43 @@ def get_embeddings(provider, api_key=None):
     else:
         raise ValueError(f"Unsupported provider: {provider}")
 
-def create_vectorstore(documents, provider, api_key, backend_type):
+def create_vectorstore(documents, provider, api_key, backend_type, embedding=None):
     """
     Creates a vectorstore (FAISS or Chroma) from Document objects.
+    An explicit embedding model overrides the provider default.
     """
-    embedding = get_embeddings(provider, api_key)
+    if embedding is None:
+        embedding = get_embeddings(provider, api_key)
     
     if "faiss" in backend_type.lower():
+        import shutil
+        import weakref
+        import tempfile
+        import faiss
+        import numpy as np
         from langchain_community.vectorstores import FAISS
-        store = FAISS.from_documents(documents, embedding)
+        from rag_logic.chunk_store import build_chunk_store, ChunkStoreDocstore, RowIdMap
+
+        # Chunk text and metadata live in a memory-mapped columnar store
+        # instead of per-chunk Documents held in an in-memory docstore.
+        vectors = np.array(
+            embedding.embed_documents([doc.page_content for doc in documents]),
+            dtype=np.float32
+        )
+        index = faiss.IndexFlatL2(vectors.shape[1])
+        index.add(vectors)
+
+        os.makedirs("./data/chunk_store", exist_ok=True)
+        store_path = tempfile.mkdtemp(dir="./data/chunk_store")
+        chunk_store = build_chunk_store(documents, store_path)
+        store = FAISS(
+            embedding,
+            index,
+            ChunkStoreDocstore(chunk_store),
+            RowIdMap(len(chunk_store))
+        )
+        # The on-disk store lives exactly as long as the vectorstore using it
+        weakref.finalize(store, shutil.rmtree, store_path, True)
         return store
     else:
         from langchain_community.vectorstores import Chroma
@@ -1,5 +1,7 @@
 from langchain_core.documents import Document
 from rag_logic.pdf_handler import get_text_chunks
+from rag_logic.chunk_store import build_chunk_store
+from rag_logic.vector_handler import create_vectorstore
 
 def test_metadata_preservation():
     # Mock Document
@@ -18,9 +20,89 @@ def test_metadata_preservation():
         assert "page" in chunk.metadata
         assert chunk.metadata["source"] == "test.pdf"
 
+def test_chunk_store_roundtrip():
+    import tempfile
+
+    docs = [
+        Document(page_content="First chunk with ünïcode.", metadata={"source": "a.pdf", "page": 1}),
+        Document(page_content="Second chunk.", metadata={"source": "b.pdf", "page": 4}),
+        Document(page_content="Third chunk.", metadata={"source": "a.pdf", "page": 2}),
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = build_chunk_store(docs, tmp)
+        print(f"Interned sources: {store.sources}")
+        assert len(store) == 3
+        assert store.sources == ["a.pdf", "b.pdf"]
+        for i, doc in enumerate(docs):
+            assert store[i].page_content == doc.page_content
+            assert store[i].metadata == doc.metadata
+
+def test_faiss_chunk_store_alignment():
+    import os
+    import gc
+    from langchain_core.embeddings import DeterministicFakeEmbedding
+
+    docs = [
+        Document(page_content="Revenue grew in the third quarter.", metadata={"source": "a.pdf", "page": 3}),
+        Document(page_content="Security audit found two issues.", metadata={"source": "b.pdf", "page": 7}),
+        Document(page_content="Appendix without page numbers.", metadata={"source": "c.pdf"}),
+    ]
+
+    store = create_vectorstore(
+        docs, "Groq", None, "FAISS (Memory-based)",
+        embedding=DeterministicFakeEmbedding(size=32)
+    )
+    store_path = store.docstore.chunk_store.path
+
+    # Identical text embeds identically, so each chunk must come back first
+    for doc in docs:
+        top = store.similarity_search(doc.page_content, k=1)[0]
+        assert top.page_content == doc.page_content
+        assert top.metadata == doc.metadata
+
+    # k beyond the index size makes FAISS pad with -1 rows, which must be skipped
+    results = store.as_retriever(search_kwargs={"k": 10}).invoke(docs[2].page_content)
+    print(f"Retrieved {len(results)} chunks for k=10")
+    assert len(results) == len(docs)
+    assert results[0].metadata == {"source": "c.pdf"}
+    assert sorted(d.page_content for d in results) == sorted(d.page_content for d in docs)
+
+    # The on-disk chunk store is removed together with the vectorstore
+    del store, results, top
+    gc.collect()
+    assert not os.path.exists(store_path)
+
+def test_percentile():
+    from load_test import percentile
+
+    samples = list(range(1, 97))
+    assert percentile(samples, 90) == 87
+    assert percentile(samples, 99) == 96
+    assert percentile([3, 1, 2, 6, 5, 4], 90) == 6
+    assert percentile([3, 1, 2, 6, 5, 4], 50) == 3
+    assert percentile([7], 1) == 7
+    assert percentile([], 50) is None
+
+def test_summarize():
+    from load_test import summarize
+
+    stats = summarize([0.5, 0.1, 0.3, 0.2, 0.4])
+    print(f"Latency summary: {stats}")
+    assert stats == {"p50": 0.3, "p90": 0.5, "p99": 0.5, "max": 0.5}
+    assert summarize([]) == {"p50": None, "p90": None, "p99": None, "max": None}
+
 if __name__ == "__main__":
     try:
         test_metadata_preservation()
         print("✅ Metadata preservation test PASSED")
+        test_chunk_store_roundtrip()
+        print("✅ Chunk store roundtrip test PASSED")
+        test_faiss_chunk_store_alignment()
+        print("✅ FAISS chunk store alignment test PASSED")
+        test_percentile()
+        print("✅ Percentile test PASSED")
+        test_summarize()
+        print("✅ Summarize test PASSED")
     except Exception as e:
         print(f"❌ Test FAILED: {e}")